@@ -1,4 +1,4 @@
-from src.infrastructure.db.pool import init_pool, close_pool, get_pool
+from src.infrastructure.db.pool import init_pool, close_pool
 from src.data.repositories import (
     ChapterRepository,
     SceneRepository,
@@ -9,8 +9,11 @@ from src.service.auth import AuthService
 from src.service.embedding.service import EmbeddingService
 from src.service.extraction import ExtractionService
 from src.infrastructure.config import config
+from src.infrastructure.redis.pubsub import RedisPubSub
+from src.infrastructure.redis.queue import client
 from src.app.dependencies import build_ai_provider
 from aiocron import Cron, crontab
+from typing import Any
 import asyncio
 import signal
 from pathlib import Path
@@ -33,6 +36,10 @@ shutdown_event = asyncio.Event()
 
 tracer = trace.get_tracer(__name__)
 
+# Long-lived services, built once in `main()` after the pool is up. Cron ticks
+# reuse them instead of rebuilding repos/services on every fire.
+ctx: dict[str, Any] = {}
+
 
 async def heartbeat_loop() -> None:
     while True:
@@ -49,10 +56,8 @@ def request_shutdown(crons: list[Cron]) -> None:
 @crontab(config.jobs.session_cleanup_cron_expression, start=False)
 async def run_session_cleanup():
     with tracer.start_as_current_span("cron.session_cleanup") as span:
-        pool = get_pool()
-        auth_service = AuthService(UserRepository(pool), SessionRepository(pool))
         try:
-            await auth_service.cleanup_expired_sessions()
+            await ctx['auth_service'].cleanup_expired_sessions()
             span.set_status(trace.StatusCode.OK)
         except Exception as e:
             logger.exception("cron.cleanup_expired_sessions.failed")
@@ -65,13 +70,8 @@ async def run_session_cleanup():
 @crontab(config.jobs.scene_extraction_cron_expression, start=False)
 async def run_reextraction_job():
     with tracer.start_as_current_span("cron.scene_extraction") as span:
-        provider = build_ai_provider()
-        pool = get_pool()
-        chapter_repo = ChapterRepository(pool)
-        scene_repo = SceneRepository(pool)
-        extraction_service = ExtractionService(provider, chapter_repo, scene_repo)
         try:
-            await extraction_service.regenerate_stale_batched()
+            await ctx['extraction_service'].regenerate_stale_batched()
             span.set_status(trace.StatusCode.OK)
         except Exception as e:
             logger.exception("cron.run_reextraction_job.failed")
@@ -84,12 +84,8 @@ async def run_reextraction_job():
 @crontab(config.jobs.scene_embedding_cron_expression, start=False)
 async def run_embedding_job():
     with tracer.start_as_current_span("cron.scene_embedding") as span:
-        provider = build_ai_provider()
-        pool = get_pool()
-        scene_repo = SceneRepository(pool)
-        embedding_service = EmbeddingService(scene_repo, provider)
         try:
-            await embedding_service.embed_pending_batched()
+            await ctx['embedding_service'].embed_pending_batched()
             span.set_status(trace.StatusCode.OK)
         except Exception as e:
             logger.exception("cron.run_embedding_job.failed")
@@ -100,7 +96,19 @@ async def run_embedding_job():
 
 
 async def main():
-    await init_pool()
+    pool = await init_pool()
+    provider = build_ai_provider()
+    chapter_repo = ChapterRepository(pool)
+    scene_repo = SceneRepository(pool)
+
+    ctx['auth_service'] = AuthService(
+        UserRepository(pool), SessionRepository(pool), RedisPubSub(client)
+    )
+    ctx['extraction_service'] = ExtractionService(
+        provider, chapter_repo, scene_repo, client
+    )
+    ctx['embedding_service'] = EmbeddingService(scene_repo, provider)
+
     logger.info("worker.started")
     heartbeat_task = asyncio.create_task(heartbeat_loop())
 
@@ -5,6 +5,7 @@ from src.app.controllers.auth import user_controller
 from src.app.controllers.chapter import chapter_controller
 from src.app.controllers.story import story_controller
 from src.app.lifespan import lifespan
+from src.app.middleware import RequestBodyLimitMiddleware
 from src.shared.utils.correlation import get_correlation_id
 from src.shared.utils.logging import configure_logger
 from src.service.exceptions import ServiceError
@@ -42,21 +43,9 @@ api = FastAPI(
 # ── Request body size limit middleware ─────────────────────────────────
 from src.infrastructure.config import config as app_config
 
-
-@api.middleware("http")
-async def limit_request_body(request: Request, call_next):
-    content_length = request.headers.get("content-length")
-    if content_length:
-        try:
-            if int(content_length) > app_config.http.max_body_size_bytes:
-                return JSONResponse(
-                    status_code=413, content={"detail": "Request body too large"}
-                )
-        except ValueError:
-            return JSONResponse(
-                status_code=400, content={"detail": "Invalid Content-Length header"}
-            )
-    return await call_next(request)
+api.add_middleware(
+    RequestBodyLimitMiddleware, max_body_size=app_config.http.max_body_size_bytes
+)
 
 
 # ── Layer exception handlers ──────────────────────────────────────────
@@ -0,0 +1,4 @@
+-- Rollback for 20261018_01_Kp3Qa-session-expires-at-index.sql
+--
+-- Reverse the changes in the forward migration above.
+DROP INDEX IF EXISTS "idx_session_expires_at";
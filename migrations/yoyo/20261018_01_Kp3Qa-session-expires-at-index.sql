@@ -0,0 +1,12 @@
+-- session_expires_at_index
+-- depends: 20260716_01_qVZ7E-added-word-count-column-to-scene-table
+--
+-- The hourly cleanup cron runs `DELETE FROM "session" WHERE expires_at < NOW()`
+-- (SessionRepository.delete_expired). Baseline only indexed user_id, so every
+-- sweep was a sequential scan over all live sessions. A btree on expires_at
+-- turns it into a range scan over just the expired rows.
+--
+-- Plain (not partial) index: expires_at is NOT NULL, and a `WHERE expires_at
+-- < now()` predicate isn't IMMUTABLE so Postgres won't accept it.
+
+CREATE INDEX IF NOT EXISTS "idx_session_expires_at" ON "session" ("expires_at");
@@ -0,0 +1,8 @@
+-- Rollback for 20261018_02_Wd8Tn-chapter-reextraction-due-index.sql
+--
+-- Reverse the changes in the forward migration above.
+CREATE INDEX IF NOT EXISTS "idx_chapter_scenes_stale"
+    ON "chapter" ("scenes_need_reextraction")
+    WHERE "scenes_need_reextraction" = TRUE;
+
+DROP INDEX IF EXISTS "idx_chapter_reextraction_due";
@@ -0,0 +1,23 @@
+-- chapter_reextraction_due_index
+-- depends: 20261018_01_Kp3Qa-session-expires-at-index
+--
+-- The re-extraction sweep (SceneRepository.list_stale_chapter_ids) asks for
+-- the oldest published chapters flagged for re-extraction whose last edit is
+-- outside the debounce window:
+--
+--   WHERE scenes_need_reextraction = TRUE AND published = TRUE
+--     AND updated_at <= NOW() - ...
+--   ORDER BY updated_at LIMIT n
+--
+-- idx_chapter_scenes_stale was keyed on the flag itself, which is constant
+-- inside its own predicate, so Postgres still had to fetch and sort every
+-- flagged row. Keying the partial index on updated_at serves the range and
+-- the ORDER BY ... LIMIT directly, and INCLUDE (id, user_id) lets the sweep
+-- run as an index-only scan. It replaces the old index, which nothing else
+-- used.
+
+CREATE INDEX IF NOT EXISTS "idx_chapter_reextraction_due"
+    ON "chapter" ("updated_at") INCLUDE ("id", "user_id")
+    WHERE "scenes_need_reextraction" = TRUE AND "published" = TRUE;
+
+DROP INDEX IF EXISTS "idx_chapter_scenes_stale";
@@ -0,0 +1,5 @@
+-- Rollback for 20261018_03_Hn5Lc-drop-redundant-indexes.sql
+--
+-- Reverse the changes in the forward migration above.
+CREATE INDEX IF NOT EXISTS "idx_user_email_1b4f1c" ON "user" ("email");
+CREATE INDEX IF NOT EXISTS "idx_story_title_8888ab" ON "story" ("title");
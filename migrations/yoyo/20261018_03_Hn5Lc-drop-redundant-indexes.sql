@@ -0,0 +1,14 @@
+-- drop_redundant_indexes
+-- depends: 20261018_02_Wd8Tn-chapter-reextraction-due-index
+--
+-- Two baseline indexes carried over from the Tortoise schema cost a B-tree
+-- write on every insert/update and serve no query:
+--
+--   * idx_user_email_1b4f1c duplicates the index Postgres already builds for
+--     the UNIQUE constraint on user.email.
+--   * idx_story_title_8888ab indexes story.title on its own; nothing looks a
+--     story up by title alone, and the (user_id, title) uniqueness check uses
+--     uid_story_user_id_8700fa.
+
+DROP INDEX IF EXISTS "idx_user_email_1b4f1c";
+DROP INDEX IF EXISTS "idx_story_title_8888ab";
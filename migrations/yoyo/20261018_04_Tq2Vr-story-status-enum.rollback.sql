@@ -0,0 +1,7 @@
+-- Rollback for 20261018_04_Tq2Vr-story-status-enum.sql
+--
+-- Reverse the changes in the forward migration above.
+ALTER TABLE "story"
+    ALTER COLUMN "status" TYPE VARCHAR(9) USING "status"::TEXT;
+
+DROP TYPE IF EXISTS "story_status";
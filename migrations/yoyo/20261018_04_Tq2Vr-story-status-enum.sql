@@ -0,0 +1,16 @@
+-- story_status_enum
+-- depends: 20261018_03_Hn5Lc-drop-redundant-indexes
+--
+-- story.status was a free VARCHAR(9): nothing in the database stopped a value
+-- outside StoryStatus from being written, and every row carried the label
+-- inline. A native enum stores a 4-byte OID and rejects unknown values on
+-- write. Labels must match StoryStatus in src/data/schemas/enums.py.
+--
+-- asyncpg encodes/decodes enum values as plain strings, so the repositories
+-- (which bind StoryStatus, a StrEnum, and the literal 'Ongoing' on insert)
+-- need no changes.
+
+CREATE TYPE "story_status" AS ENUM ('Complete', 'On Hiatus', 'Ongoing');
+
+ALTER TABLE "story"
+    ALTER COLUMN "status" TYPE "story_status" USING "status"::"story_status";
@@ -0,0 +1,6 @@
+-- Rollback for 20261018_05_Mb7Rx-story-user-created-index.sql
+--
+-- Reverse the changes in the forward migration above.
+CREATE INDEX IF NOT EXISTS "idx_story_user_id_4d5372" ON "story" ("user_id");
+
+DROP INDEX IF EXISTS "idx_story_user_created";
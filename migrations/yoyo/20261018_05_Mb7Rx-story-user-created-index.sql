@@ -0,0 +1,18 @@
+-- story_user_created_index
+-- depends: 20261018_04_Tq2Vr-story-status-enum
+--
+-- The story grid (StoryRepository.list_for_user) runs
+--   WHERE user_id = $1 ORDER BY created_at DESC
+-- on every dashboard load. The baseline only had a single-column user_id
+-- index, so Postgres fetched the user's stories and sorted them. A composite
+-- (user_id, created_at DESC) index returns them already ordered and replaces
+-- the single-column one, which it makes redundant.
+--
+-- Chapter listings need no new index: they filter on (user_id, story_id),
+-- which uid_chapter_user_id_887e2d already leads with, and order by
+-- path_array position, which no index can serve.
+
+CREATE INDEX IF NOT EXISTS "idx_story_user_created"
+    ON "story" ("user_id", "created_at" DESC);
+
+DROP INDEX IF EXISTS "idx_story_user_id_4d5372";
@@ -0,0 +1,5 @@
+-- Rollback for 20261018_06_Rc4Zh-chapter-scenes-content-hash.sql
+--
+-- Reverse the changes in the forward migration above.
+ALTER TABLE "chapter"
+    DROP COLUMN IF EXISTS "scenes_content_hash";
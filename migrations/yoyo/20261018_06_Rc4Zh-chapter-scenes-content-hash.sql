@@ -0,0 +1,12 @@
+-- chapter_scenes_content_hash
+-- depends: 20261018_05_Mb7Rx-story-user-created-index
+--
+-- The stale-chapter sweep skips the LLM when a chapter's text hasn't moved
+-- since its scenes were extracted. Checking that the stored scene quotes
+-- still appear in the text misses prose added between or around them, so
+-- record a SHA-256 of the exact plain text each extraction ran on and
+-- compare against that instead. NULL (never extracted under this scheme)
+-- always re-extracts.
+
+ALTER TABLE "chapter"
+    ADD COLUMN IF NOT EXISTS "scenes_content_hash" TEXT;
@@ -57,7 +57,8 @@ async def startup(ctx: Context) -> None:
     extraction_service = ExtractionService(
         provider=provider,
         chapter_repo=chapter_repo,
-        scene_repo=scene_repo
+        scene_repo=scene_repo,
+        redis=client
     )
     embedding_service = EmbeddingService(
         scene_repo=scene_repo,
@@ -124,31 +125,41 @@ async def story_reanalysis_job(
 ) -> None:
     with tracer.start_as_current_span("saq.story_reanalysis_job") as span:
         try:
+            # Every pass reads the same whole-story context; build it once.
+            story_context = await ctx['worker'].context['story_service'].get_story_context(
+                user_id, story_id
+            )
+
             await asyncio.gather(
                 ctx['worker'].context['story_service'].get_pulse(
                     user_id=user_id,
                     story_id=story_id,
-                    ignore_cache=True
+                    ignore_cache=True,
+                    story_context=story_context
                 ),
                 ctx['worker'].context['analytics_service'].extract_plot_threads(
                     story_id=story_id,
                     user_id=user_id,
-                    ignore_cache=True
+                    ignore_cache=True,
+                    story_context=story_context
                 ),
                 ctx['worker'].context['analytics_service'].extract_acts(
                     story_id=story_id,
                     user_id=user_id,
-                    ignore_cache=True
+                    ignore_cache=True,
+                    story_context=story_context
                 ),
                 ctx['worker'].context['analytics_service'].extract_contradictions(
                     story_id=story_id,
                     user_id=user_id,
-                    ignore_cache=True
+                    ignore_cache=True,
+                    story_context=story_context
                 ),
                 ctx['worker'].context['analytics_service'].extract_entities(
                     story_id=story_id,
                     user_id=user_id,
-                    ignore_cache=True
+                    ignore_cache=True,
+                    story_context=story_context
                 )
             )
 
@@ -176,9 +187,7 @@ async def chapter_reanalysis_job(
 ) -> None:
     with tracer.start_as_current_span("saq.chapter_reanalysis_job") as span:
         try:
-            chapter = await ctx['worker'].context['chapter_repo'].get(chapter_id, user_id)
-
-            if chapter is None or not chapter.published:
+            if not await ctx['worker'].context['chapter_repo'].is_published(chapter_id, user_id):
                 return
 
             await ctx['worker'].context['chapter_service'].summarize_chapter(
@@ -219,9 +228,7 @@ async def scene_and_embedding_job(
 ) -> None:
     with tracer.start_as_current_span("saq.scene_and_embedding_job") as span:
         try:
-            chapter = await ctx['worker'].context['chapter_repo'].get(chapter_id, user_id)
-
-            if chapter is None or not chapter.published:
+            if not await ctx['worker'].context['chapter_repo'].is_published(chapter_id, user_id):
                 return
 
             result: Optional[SceneExtractionResult] = \
@@ -229,12 +236,8 @@ async def scene_and_embedding_job(
                     chapter_id, user_id, content
                 )
 
-            chapter = await ctx['worker'].context['chapter_repo'].get(chapter_id, user_id)
-
-            if chapter is None or not chapter.published:
+            if not await ctx['worker'].context['chapter_repo'].is_published(chapter_id, user_id):
                 return
-            
-            await ctx['worker'].context['embedding_service'].embed_scenes(chapter_id)
 
             if result:
                 await ctx['worker'].context['pubsub'].publish(
@@ -250,11 +253,20 @@ async def scene_and_embedding_job(
             await client.set(f"chapter:baseline:{chapter_id}", content or "")
             await client.delete(f"chapter:extraction-pending:{chapter_id}")
 
+            story_context = await ctx['worker'].context['story_service'].get_story_context(
+                user_id, story_id
+            )
+
+            # Embedding and the story-level analysis passes only depend on the
+            # freshly written scene rows, not on each other, so run them side
+            # by side — the job takes as long as the slowest call, not the sum.
             await asyncio.gather(
+                ctx['worker'].context['embedding_service'].embed_scenes(chapter_id),
                 ctx['worker'].context['story_service'].get_pulse(
                     user_id=user_id,
                     story_id=story_id,
-                    ignore_cache=True
+                    ignore_cache=True,
+                    story_context=story_context
                 ),
                 ctx['worker'].context['chapter_service'].summarize_chapter(
                     user_id=user_id,
@@ -264,22 +276,26 @@ async def scene_and_embedding_job(
                 ctx['worker'].context['analytics_service'].extract_plot_threads(
                     story_id=story_id,
                     user_id=user_id,
-                    ignore_cache=True
+                    ignore_cache=True,
+                    story_context=story_context
                 ),
                 ctx['worker'].context['analytics_service'].extract_acts(
                     story_id=story_id,
                     user_id=user_id,
-                    ignore_cache=True
+                    ignore_cache=True,
+                    story_context=story_context
                 ),
                 ctx['worker'].context['analytics_service'].extract_contradictions(
                     story_id=story_id,
                     user_id=user_id,
-                    ignore_cache=True
+                    ignore_cache=True,
+                    story_context=story_context
                 ),
                 ctx['worker'].context['analytics_service'].extract_entities(
                     story_id=story_id,
                     user_id=user_id,
-                    ignore_cache=True
+                    ignore_cache=True,
+                    story_context=story_context
                 )
             )
 
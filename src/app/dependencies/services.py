@@ -144,8 +144,9 @@ def get_extraction_service(
     provider: AIProvider = Depends(get_ai_provider),
     chapter_repo: ChapterRepository = Depends(get_chapter_repository),
     scene_repo: SceneRepository = Depends(get_scene_repository),
+    redis: aioredis.Redis = Depends(get_redis),
 ) -> ExtractionService:
-    return ExtractionService(provider, chapter_repo, scene_repo)
+    return ExtractionService(provider, chapter_repo, scene_repo, redis)
 
 
 def get_chat_service(
@@ -0,0 +1,5 @@
+from src.app.middleware.body_limit import RequestBodyLimitMiddleware
+
+__all__ = [
+    "RequestBodyLimitMiddleware",
+]
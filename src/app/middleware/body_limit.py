@@ -0,0 +1,36 @@
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class RequestBodyLimitMiddleware:
+    """Reject requests whose declared Content-Length exceeds ``max_body_size``."""
+
+    def __init__(self, app: ASGIApp, max_body_size: int) -> None:
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name != b"content-length":
+                continue
+            try:
+                too_large = int(value) > self.max_body_size
+            except ValueError:
+                response = JSONResponse(
+                    status_code=400, content={"detail": "Invalid Content-Length header"}
+                )
+                await response(scope, receive, send)
+                return
+            if too_large:
+                response = JSONResponse(
+                    status_code=413, content={"detail": "Request body too large"}
+                )
+                await response(scope, receive, send)
+                return
+            break
+
+        await self.app(scope, receive, send)
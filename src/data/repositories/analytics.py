@@ -34,7 +34,9 @@ class AnalyticsRepository:
 
         rows = await self._exe(executor).fetch(sql, story_id, user_id)
 
-        return [(r["pov"], r["scene_count"], r["word_count"]) for r in rows]
+        # Records are already sequences in SELECT-list order, so copying them
+        # wholesale avoids a key lookup per column.
+        return [tuple(r) for r in rows]
 
     async def get_character_co_occurence_statistics(
         self, story_id: str, user_id: str, *, executor: Executor | None = None
@@ -61,10 +63,7 @@ class AnalyticsRepository:
 
         rows = await self._exe(executor).fetch(sql, story_id, user_id)
 
-        return [
-            (r["character_a"], r["character_b"], r["scene_count"], r["word_count"])
-            for r in rows
-        ]
+        return [tuple(r) for r in rows]
 
     async def get_character_statistics(
         self, story_id: str, user_id: str, *, executor: Executor | None = None
@@ -88,16 +87,7 @@ class AnalyticsRepository:
 
         rows = await self._exe(executor).fetch(sql, story_id, user_id)
 
-        return [
-            (
-                r["chapter_id"],
-                r["chapter_number"],
-                r["character"],
-                r["scene_count"],
-                r["word_count"],
-            )
-            for r in rows
-        ]
+        return [tuple(r) for r in rows]
 
     async def get_scene_length_distribution(
         self, story_id: str, user_id: str, *, executor: Executor | None = None
@@ -125,7 +115,7 @@ class AnalyticsRepository:
 
         rows = await self._exe(executor).fetch(sql, story_id, user_id)
 
-        return [(r["scene_length"], r["scene_count"]) for r in rows]
+        return [tuple(r) for r in rows]
 
     async def get_tension_and_pacing_curves(
         self, story_id: str, user_id: str, *, executor: Executor | None = None
@@ -162,70 +152,7 @@ class AnalyticsRepository:
 
         rows = await self._exe(executor).fetch(sql, story_id, user_id)
 
-        return [
-            (
-                r["chapter_id"],
-                r["chapter_number"],
-                r["avg_tension"],
-                r["avg_pacing"],
-                r["scene_count"],
-                r["word_count"],
-            )
-            for r in rows
-        ]
-
-    async def get_recent_chapters_rythm(
-        self,
-        story_id: str,
-        user_id: str,
-        k: int = 8,
-        *,
-        executor: Executor | None = None,
-    ) -> list[tuple[str, int, float, float, int, int]]:
-        sql = """\
-        SELECT
-            sc.chapter_id AS chapter_id,
-            ARRAY_POSITION(s.path_array, sc.chapter_id) AS chapter_number,
-            AVG(
-                CASE
-                    WHEN sc.tension = 'low' THEN 1.0
-                    WHEN sc.tension = 'medium' THEN 2.0
-                    WHEN sc.tension = 'high' THEN 3.0
-                END
-            ) AS avg_tension,
-            AVG(
-                CASE
-                    WHEN sc.pacing = 'slow' THEN 1.0
-                    WHEN sc.pacing = 'steady' THEN 2.0
-                    WHEN sc.pacing = 'fast' THEN 3.0
-                END
-            ) AS avg_pacing,
-            COUNT(*) AS scene_count,
-            SUM(sc.word_count) AS word_count
-        FROM "scene" sc
-        INNER JOIN "chapter" c ON sc.chapter_id = c.id
-        INNER JOIN "story" s ON sc.story_id = s.id
-        WHERE sc.story_id = $1
-          AND sc.user_id = $2
-          AND c.published = TRUE
-        GROUP BY chapter_id, chapter_number
-        ORDER BY chapter_number DESC
-        LIMIT $3
-        """
-
-        rows = await self._exe(executor).fetch(sql, story_id, user_id, k)
-
-        return [
-            (
-                r["chapter_id"],
-                r["chapter_number"],
-                r["avg_tension"],
-                r["avg_pacing"],
-                r["scene_count"],
-                r["word_count"],
-            )
-            for r in rows
-        ]
+        return [tuple(r) for r in rows]
 
     async def get_entity_statistics(
         self, story_id: str, user_id: str, *, executor: Executor | None = None
@@ -257,7 +184,7 @@ class AnalyticsRepository:
 
         rows = await self._exe(executor).fetch(sql, user_id, story_id)
 
-        return [(r["entity"], r["n"], r["sample_description"]) for r in rows]
+        return [tuple(r) for r in rows]
 
     async def get_questions_raised_by_chapter(
         self, story_id: str, user_id: str, *, executor: Executor | None = None
@@ -280,7 +207,4 @@ class AnalyticsRepository:
 
         rows = await self._exe(executor).fetch(sql, story_id, user_id)
 
-        return [
-            (r["chapter_id"], r["chapter_number"], r["question_raised"])
-            for r in rows
-        ]
+        return [tuple(r) for r in rows]
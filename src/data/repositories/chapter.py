@@ -18,12 +18,22 @@ from typing import Any, Sequence
 import asyncpg
 
 from src.data.schemas.enums import generate_uuid
-from src.data.schemas import ChapterRow
+from src.data.schemas import ChapterListRow, ChapterRow
 
 
 _CHAPTER_COLUMNS = """
     id, story_id, user_id, title, content, published, word_count,
     next_chapter_id, prev_chapter_id,
+    scenes_need_reextraction, scenes_extracted_at, scenes_content_hash,
+    created_at, updated_at
+"""
+
+# List endpoints only render titles, counts and flags. Leaving `content` out
+# keeps them from detoasting every chapter body; rows built from these
+# columns are ChapterListRow, which has no content field.
+_CHAPTER_LIST_COLUMNS = """
+    id, story_id, user_id, title, published, word_count,
+    next_chapter_id, prev_chapter_id,
     scenes_need_reextraction, scenes_extracted_at,
     created_at, updated_at
 """
@@ -56,6 +66,19 @@ class ChapterRepository:
         row = await self._exe(executor).fetchrow(sql, chapter_id, user_id)
         return ChapterRow.model_validate(dict(row)) if row else None
 
+    async def is_published(
+        self,
+        chapter_id: str,
+        user_id: str,
+        *,
+        executor: Executor | None = None,
+    ) -> bool | None:
+        """Publication flag only — None if the chapter doesn't exist. For
+        callers that gate on `published` and would otherwise pull the whole
+        row (content included) just to read one boolean."""
+        sql = 'SELECT published FROM "chapter" WHERE id = $1 AND user_id = $2'
+        return await self._exe(executor).fetchval(sql, chapter_id, user_id)
+
     async def get_for_system(
         self,
         chapter_id: str,
@@ -79,7 +102,7 @@ class ChapterRepository:
             SELECT
                 c.id, c.story_id, c.user_id, c.title, c.content, c.published,
                 c.word_count, c.next_chapter_id, c.prev_chapter_id,
-                c.created_at, c.updated_at,
+                c.scenes_content_hash, c.created_at, c.updated_at,
                 s.title AS story_title,
                 ARRAY_POSITION(s.path_array, c.id) AS chapter_number
              FROM "chapter" c
@@ -100,10 +123,15 @@ class ChapterRepository:
         user_id: str,
         *,
         executor: Executor | None = None,
-    ) -> list[tuple[ChapterRow, str, int]]:
+    ) -> list[tuple[ChapterListRow, str, int | None]]:
+        """`(chapter, story_title, chapter_number)` in reading order. The
+        number comes from the story's path_array in the same query, so
+        callers never need to load the path and index into it themselves;
+        chapters missing from the path sort last with a None number.
+        Content is not loaded (see _CHAPTER_LIST_COLUMNS)."""
         sql = """
             SELECT
-                c.id, c.story_id, c.user_id, c.title, c.content, c.published,
+                c.id, c.story_id, c.user_id, c.title, c.published,
                 c.word_count, c.next_chapter_id, c.prev_chapter_id,
                 c.created_at, c.updated_at,
                 s.title AS story_title,
@@ -111,7 +139,7 @@ class ChapterRepository:
              FROM "chapter" c
              JOIN "story" s ON s.id = c.story_id
              WHERE c.story_id = $1 AND c.user_id = $2
-             ORDER BY created_at DESC
+             ORDER BY chapter_number NULLS LAST, c.created_at DESC
         """
         rows = await self._exe(executor).fetch(sql, story_id, user_id)
 
@@ -120,36 +148,39 @@ class ChapterRepository:
         for row in rows:
             d = dict(row)
             story_title: str = d.pop("story_title")
-            chapter_number: int = d.pop("chapter_number")
-            results.append((ChapterRow.model_validate(d), story_title, chapter_number))
+            chapter_number: int | None = d.pop("chapter_number")
+            results.append((ChapterListRow.model_validate(d), story_title, chapter_number))
 
         return results
 
-    async def list_by_ids(
+    async def list_published_ids(
         self,
-        chapter_ids: Sequence[str]
-    ) -> list[ChapterRow]:
+        chapter_ids: Sequence[str],
+    ) -> list[str]:
+        """Subset of `chapter_ids` that are published. Projection-only, for
+        callers that just filter on the flag."""
         if not chapter_ids:
             return []
-        sql = f"""
-        SELECT {_CHAPTER_COLUMNS} FROM "chapter"
-        WHERE id = ANY($1::TEXT[])
+        sql = """
+        SELECT id FROM "chapter"
+        WHERE id = ANY($1::TEXT[]) AND published = TRUE
         """
         rows = await self._pool.fetch(sql, list(chapter_ids))
-        return [ChapterRow.model_validate(dict(r)) for r in rows]
+        return [r["id"] for r in rows]
 
     async def list_by_story_ids(
         self,
         story_ids: Sequence[str],
-    ) -> list[ChapterRow]:
+    ) -> list[ChapterListRow]:
+        """Chapters for several stories at once, without content."""
         if not story_ids:
             return []
         sql = f"""
-            SELECT {_CHAPTER_COLUMNS} FROM "chapter"
+            SELECT {_CHAPTER_LIST_COLUMNS} FROM "chapter"
              WHERE story_id = ANY($1::TEXT[])
         """
         rows = await self._pool.fetch(sql, list(story_ids))
-        return [ChapterRow.model_validate(dict(r)) for r in rows]
+        return [ChapterListRow.model_validate(dict(r)) for r in rows]
 
     async def create(
         self,
@@ -241,6 +272,9 @@ class ChapterRepository:
 
         Implementation: one UPDATE that joins the chapter table against
         unnest(path WITH ORDINALITY), using lag/lead to compute neighbours.
+        Rows whose pointers already match are filtered out, so an append or
+        delete rewrites the two or three neighbours it touches, not every
+        chapter in the story.
 
         Safety: relies on the deferrable unique constraints on
         prev_chapter_id / next_chapter_id (migration 00002) — without them,
@@ -278,5 +312,7 @@ class ChapterRepository:
               FROM ordered o
              WHERE c.id = o.id
                AND c.story_id = $1
+               AND (c.prev_chapter_id IS DISTINCT FROM o.prev_id
+                    OR c.next_chapter_id IS DISTINCT FROM o.next_id)
         """
         await self._exe(executor).execute(sql, story_id, list(path))
@@ -1,5 +1,5 @@
 import asyncpg
-from typing import Any, List, Literal, Optional
+from typing import Any, List, Literal, Optional, Sequence
 from uuid_extensions import uuid7str
 import json
 from src.data.schemas.chat import ChatMessageRow, ChatThreadRow
@@ -98,53 +98,55 @@ class ChatRepository:
         """
         await self._exe(executor).execute(sql, thread_id, user_id)
 
-    async def append_message(
+    async def append_messages(
         self,
         thread_id: str,
         user_id: str,
-        kind: Literal["request", "response"],
-        message: dict,
+        messages: Sequence[tuple[Literal["request", "response"], dict]],
         *,
         executor: Executor | None = None,
-    ) -> ChatMessageRow:
-        """Append one pydantic-ai ModelMessage to a thread.
+    ) -> int:
+        """Append `(kind, message)` pairs to a thread in one INSERT.
 
-        `message` must be the dict produced by
+        Each `message` must be the dict produced by
         `ModelMessagesTypeAdapter.dump_python([msg])[0]` (or
         `msg.model_dump(mode="json")`). `kind` matches pydantic-ai's
         ModelMessage discriminator and must agree with the dict's own
         `"kind"` field; we accept it explicitly so the column is indexable.
+        Sequences continue from the thread's current maximum in list order.
+        Returns rows inserted.
         """
+        if not messages:
+            return 0
 
         sql = """
         INSERT INTO "chat_message" (id, thread_id, user_id, sequence, kind, message)
-        VALUES (
+        SELECT
+            m.id,
             $1,
             $2,
-            $3,
-            (
-                SELECT COALESCE(MAX(sequence) + 1, 0)
-                FROM "chat_message"
-                WHERE thread_id=$2::varchar
-            ),
-            $4,
-            $5::jsonb
-        )
-        RETURNING *
+            base.next_sequence + m.ord - 1,
+            m.kind,
+            m.message::jsonb
+        FROM unnest($3::text[], $4::text[], $5::text[])
+                WITH ORDINALITY AS m(id, kind, message, ord)
+        CROSS JOIN (
+            SELECT COALESCE(MAX(sequence) + 1, 0) AS next_sequence
+            FROM "chat_message"
+            WHERE thread_id=$1::varchar
+        ) AS base
         """
 
-        row = await self._exe(executor).fetchrow(
+        status = await self._exe(executor).execute(
             sql,
-            uuid7str(),
             thread_id,
             user_id,
-            kind,
-            json.dumps(message),
+            [uuid7str() for _ in messages],
+            [kind for kind, _ in messages],
+            [json.dumps(message) for _, message in messages],
         )
-
-        parsed = dict(row)
-        parsed["message"] = json.loads(parsed["message"])
-        return ChatMessageRow.model_validate(parsed)
+        # "INSERT 0 3" → 3
+        return int(status.split()[-1])
 
     async def list_messages(
         self,
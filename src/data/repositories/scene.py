@@ -9,7 +9,6 @@ so a re-extraction atomically swaps the scene set for a chapter.
 
 from __future__ import annotations
 
-from datetime import datetime, timezone, timedelta
 from time import perf_counter
 from typing import Any, Literal, Sequence
 
@@ -36,6 +35,31 @@ _SCENE_COLUMNS = """
 Executor = Any
 
 
+def _slice_scene_text(
+    chapter_plain_text: str, start_quote: str, end_quote: str
+) -> str | None:
+    """The span of `chapter_plain_text` from `start_quote` through
+    `end_quote`, or None if either quote isn't found."""
+    start_idx = chapter_plain_text.find(start_quote)
+    if start_idx == -1:
+        return None
+    end_idx = chapter_plain_text.find(end_quote)
+    if end_idx == -1:
+        return None
+
+    return chapter_plain_text[start_idx : end_idx + len(end_quote)]
+
+
+def _scene_word_count(
+    chapter_plain_text: str, start_quote: str, end_quote: str
+) -> int:
+    scene_text = _slice_scene_text(chapter_plain_text, start_quote, end_quote)
+    if scene_text is None:
+        return 0
+
+    return len(scene_text.split())
+
+
 class SceneRepository:
     def __init__(self, pool: asyncpg.Pool):
         self._pool = pool
@@ -64,50 +88,6 @@ class SceneRepository:
         rows = await self._exe(executor).fetch(sql, chapter_id)
         return [SceneRow.model_validate(dict(r)) for r in rows]
 
-    async def get_scene_text(
-        self,
-        chapter_id: str,
-        start_quote: str,
-        end_quote: str,
-        *,
-        executor: Executor | None = None,
-    ) -> str | None:
-        chapter_text_sql = """\
-        SELECT content
-        FROM "chapter"
-        WHERE id = $1
-        """
-
-        chapter_text_raw = await self._exe(executor).fetchrow(
-            chapter_text_sql, chapter_id
-        )
-
-        chapter_plain_text = html_to_plain_text(chapter_text_raw["content"])
-
-        start_idx = chapter_plain_text.find(start_quote)
-        if start_idx == -1:
-            return None
-        end_idx = chapter_plain_text.find(end_quote)
-        if end_idx == -1:
-            return None
-
-        return chapter_plain_text[start_idx : end_idx + len(end_quote)]
-
-    async def get_scene_word_count(
-        self,
-        chapter_id: str,
-        start_quote: str,
-        end_quote: str,
-        *,
-        executor: Executor | None = None,
-    ) -> int:
-        scene_text = await self.get_scene_text(chapter_id, start_quote, end_quote)
-
-        if scene_text is None:
-            return 0
-
-        return len(scene_text.split())
-
     async def list_by_story(
         self,
         story_id: str,
@@ -116,16 +96,20 @@ class SceneRepository:
         chapter_id: str | None = None,
         executor: Executor | None = None,
     ) -> list[SceneRow]:
+        """Scenes of the story's published chapters up to and including
+        `chapter_id` (the whole story when None), in reading order: chapter
+        position in path_array, then scene position within the chapter."""
         sql = f"""
             WITH story_ids AS (
-                SELECT UNNEST(
-                    path_array[1 : COALESCE(
-                        array_position(path_array, $3),
-                        cardinality(path_array)
-                    )]
-                ) AS chapter_id
-                FROM story
-                WHERE id = $1
+                SELECT p.chapter_id, p.path_pos
+                FROM story,
+                     UNNEST(
+                         path_array[1 : COALESCE(
+                             array_position(path_array, $3),
+                             cardinality(path_array)
+                         )]
+                     ) WITH ORDINALITY AS p(chapter_id, path_pos)
+                WHERE story.id = $1
             )
             SELECT 
                 sc.id AS id, 
@@ -150,11 +134,11 @@ class SceneRepository:
                 sc.word_count AS word_count
             FROM "scene" sc
             INNER JOIN "chapter" c ON c.id = sc.chapter_id
+            INNER JOIN story_ids sp ON sp.chapter_id = sc.chapter_id
             WHERE sc.story_id = $1 
                 AND sc.user_id = $2
-                AND sc.chapter_id IN (SELECT chapter_id FROM story_ids)
                 AND c.published = TRUE
-            ORDER BY sc.chapter_id, sc.position ASC
+            ORDER BY sp.path_pos, sc.position ASC
         """
         rows = await self._exe(executor).fetch(sql, story_id, user_id, chapter_id)
         return [SceneRow.model_validate(dict(r)) for r in rows]
@@ -249,6 +233,13 @@ class SceneRepository:
         if not scenes:
             return
 
+        # Parse the chapter once for every scene's word count, rather than
+        # re-fetching and re-parsing it per scene.
+        chapter_content = await conn.fetchval(
+            'SELECT content FROM "chapter" WHERE id = $1', chapter_id
+        )
+        chapter_plain_text = html_to_plain_text(chapter_content or "")
+
         rows = [
             (
                 uuid7str(),
@@ -266,10 +257,8 @@ class SceneRepository:
                 scene.mentioned_entities,
                 scene.tags,
                 scene.questions_raised,
-                (
-                    await self.get_scene_word_count(
-                        chapter_id, scene.start_quote, scene.end_quote
-                    )
+                _scene_word_count(
+                    chapter_plain_text, scene.start_quote, scene.end_quote
                 ),
             )
             for position, scene in enumerate(scenes)
@@ -299,35 +288,48 @@ class SceneRepository:
             ],
         )
 
-    async def update_embedding(
+    async def update_embeddings(
         self,
         *,
-        scene_id: str,
-        embedding: Sequence[float],
+        embeddings: Sequence[tuple[str, Sequence[float]]],
         embedding_model: str,
         executor: Executor | None = None,
-    ) -> None:
-        """Patch in an embedding vector. Called by the embedding worker —
-        application code never reads `embedding` directly here.
-
-        `embedding` is a list[float]; pgvector accepts it via str cast.
+    ) -> int:
+        """Patch in embedding vectors for a whole batch of
+        `(scene_id, embedding)` pairs in one `UPDATE ... FROM unnest(...)`
+        statement — one round-trip and one commit instead of one per scene.
+        Called by the embedding worker; application code never reads
+        `embedding` directly here.
+
+        Returns the number of scene rows updated (scenes deleted by a
+        concurrent re-extraction simply don't match).
         """
+        if not embeddings:
+            return 0
+
         sql = """
-            UPDATE "scene"
-               SET embedding = $2::vector,
+            UPDATE "scene" AS sc
+               SET embedding = v.embedding::vector,
                    embedding_model = $3,
                    embedded_at = NOW(),
                    updated_at = NOW()
-             WHERE id = $1
+              FROM unnest($1::text[], $2::text[]) AS v(id, embedding)
+             WHERE sc.id = v.id
         """
+        scene_ids = [scene_id for scene_id, _ in embeddings]
         # pgvector text format: '[1.0,2.0,3.0]'
-        embedding_text = "[" + ",".join(repr(float(x)) for x in embedding) + "]"
-        await self._exe(executor).execute(
+        embedding_texts = [
+            "[" + ",".join(repr(float(x)) for x in embedding) + "]"
+            for _, embedding in embeddings
+        ]
+        status = await self._exe(executor).execute(
             sql,
-            scene_id,
-            embedding_text,
+            scene_ids,
+            embedding_texts,
             embedding_model,
         )
+        # asyncpg returns e.g. "UPDATE 12"
+        return int(status.split()[-1])
 
     # ─── chapter-level extraction status ───────────────────────────────────
 
@@ -349,19 +351,25 @@ class SceneRepository:
     async def mark_chapter_extracted(
         self,
         chapter_id: str,
+        content_hash: str,
         *,
         executor: Executor | None = None,
     ) -> None:
-        """Clear the stale flag and stamp `scenes_extracted_at`. Called at
-        the end of a successful extraction, inside the same transaction."""
+        """Clear the stale flag, stamp `scenes_extracted_at` and record the
+        hash of the text the scenes were extracted from. Called at the end of
+        a successful extraction, inside the same transaction.
+
+        Writes only the extraction bookkeeping columns. `updated_at` is the
+        author's last-edit time (dashboard streak, "jump back in", the
+        re-extraction debounce) and a worker pass must not bump it."""
         sql = """
             UPDATE "chapter"
                SET scenes_need_reextraction = FALSE,
                    scenes_extracted_at = NOW(),
-                   updated_at = NOW()
+                   scenes_content_hash = $2
              WHERE id = $1
         """
-        await self._exe(executor).execute(sql, chapter_id)
+        await self._exe(executor).execute(sql, chapter_id, content_hash)
 
     async def list_stale_chapter_ids(
         self,
@@ -369,22 +377,22 @@ class SceneRepository:
         window_seconds: int,
         limit: int,
         executor: Executor | None = None,
-    ) -> tuple[list[str], str]:
-        """Chapters flagged for re-extraction whose last edit is older than
-        `window_seconds` (debounce — don't re-extract while the user is
-        actively typing). Ordered oldest-first."""
-        cutoff = datetime.now(timezone.utc) - timedelta(seconds=window_seconds)
+    ) -> list[tuple[str, str]]:
+        """`(chapter_id, user_id)` pairs for chapters flagged for re-extraction
+        whose last edit is older than `window_seconds` (debounce — don't
+        re-extract while the user is actively typing). Ordered oldest-first.
+        Each pair carries its own owner — a sweep spans every user."""
         sql = """
             SELECT id, user_id
               FROM "chapter"
              WHERE scenes_need_reextraction = TRUE
-               AND updated_at <= $1
+               AND updated_at <= NOW() - make_interval(secs => $1::int)
                AND published = TRUE
              ORDER BY updated_at ASC
              LIMIT $2
         """
-        rows = await self._exe(executor).fetch(sql, cutoff, limit)
-        return [r["id"] for r in rows], rows[0]["user_id"]
+        rows = await self._exe(executor).fetch(sql, window_seconds, limit)
+        return [(r["id"], r["user_id"]) for r in rows]
 
     async def search_scenes(
         self,
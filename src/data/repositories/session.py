@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime
 
 import asyncpg
 
@@ -63,8 +63,8 @@ class SessionRepository:
 
     async def delete_expired(self) -> int:
         """Delete all sessions with expires_at < now. Returns count removed."""
-        sql = 'DELETE FROM "session" WHERE expires_at < $1'
+        sql = 'DELETE FROM "session" WHERE expires_at < NOW()'
         async with self._pool.acquire() as conn:
-            status = await conn.execute(sql, datetime.now(timezone.utc))
+            status = await conn.execute(sql)
         # "DELETE 7" → 7
         return int(status.split()[-1])
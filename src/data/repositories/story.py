@@ -129,6 +129,32 @@ class StoryRepository:
         """
         await self._exe(executor).execute(sql, story_id, list(path))
 
+    async def append_to_path(
+        self,
+        story_id: str,
+        chapter_id: str,
+        *,
+        executor: Executor | None = None,
+    ) -> list[str] | None:
+        """Append `chapter_id` to the end of the story's path_array (no-op if
+        it's already there) and return the resulting path, or None if the
+        story doesn't exist. Read-modify-write in one statement: no separate
+        fetch, and no Python-side membership scan over the path."""
+        sql = """
+            UPDATE "story"
+               SET path_array = CASE
+                       WHEN $2 = ANY(path_array) THEN path_array
+                       ELSE array_append(COALESCE(path_array, '{}'::TEXT[]), $2)
+                   END,
+                   updated_at = NOW()
+             WHERE id = $1
+            RETURNING path_array
+        """
+        row = await self._exe(executor).fetchrow(sql, story_id, chapter_id)
+        if row is None:
+            return None
+        return list(row["path_array"] or [])
+
     async def get_path_array(
         self,
         story_id: str,
@@ -162,7 +188,7 @@ class StoryRepository:
         sql = """
            WITH unique_dates AS (
                 SELECT DISTINCT
-                    DATE_TRUNC('day', updated_at)::date AS active_date
+                    updated_at::date AS active_date
                 FROM chapter
                 WHERE user_id = $1 AND story_id = $2
             ),
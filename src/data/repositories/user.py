@@ -63,7 +63,7 @@ class UserRepository:
             agg_sql = """
             WITH unique_dates AS (
                 SELECT DISTINCT
-                    DATE_TRUNC('day', updated_at)::date AS active_date
+                    updated_at::date AS active_date
                 FROM chapter
                 WHERE user_id = $1
             ),
@@ -25,6 +25,7 @@ from .chat import *
 #     "UpdateChapterRequest",
 #     "ReorderChapterRequest",
 #     "ChapterRow",
+#     "ChapterListRow",
 #     "ChapterListItem",
 #     "ChapterContentResponse",
 #     "ChapterListResponse",
@@ -8,6 +8,11 @@ from src.data.schemas.chapter import ChapterListItem
 from src.infrastructure.config import config
 
 
+# Config is frozen, so the pattern can be compiled once at import instead of
+# being looked up (and cache-probed) by `re` on every registration.
+_PASSWORD_RE = re.compile(config.auth.password_pattern)
+
+
 class RegistrationData(ApiModel):
     username: str = Field(min_length=1, max_length=100)
     email: EmailStr
@@ -17,7 +22,7 @@ class RegistrationData(ApiModel):
     @field_validator("password")
     @classmethod
     def validate_password_strength(cls, v: str) -> str:
-        if not re.match(config.auth.password_pattern, v):
+        if not _PASSWORD_RE.match(v):
             raise ValueError(
                 "Password must be at least 8 characters and contain "
                 "an uppercase letter, lowercase letter, digit, and special character"
@@ -6,8 +6,9 @@ from src.data.schemas._base import ApiModel
 from src.data.schemas.enums import StoryStatus
 
 
-class ChapterRow(BaseModel):
-    """One row from the `chapter` table."""
+class ChapterListRow(BaseModel):
+    """One row from the `chapter` table, without `content`. What the list
+    queries return."""
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -15,17 +16,23 @@ class ChapterRow(BaseModel):
     story_id: str
     user_id: str
     title: str
-    content: Optional[str] = ""
     published: bool
     word_count: int
     next_chapter_id: Optional[str]
     prev_chapter_id: Optional[str]
     scenes_need_reextraction: bool = False
     scenes_extracted_at: Optional[datetime] = None
+    scenes_content_hash: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
 
+class ChapterRow(ChapterListRow):
+    """One row from the `chapter` table."""
+
+    content: Optional[str] = ""
+
+
 class CreateChapterRequest(ApiModel):
     title: str = Field(min_length=1, max_length=255)
 
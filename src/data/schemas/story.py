@@ -3,7 +3,7 @@ from typing import List, Optional
 from datetime import datetime
 from src.data.schemas._base import ApiModel
 from src.data.schemas.enums import StoryStatus
-from src.data.schemas.chapter import ChapterListItem, ChapterRow
+from src.data.schemas.chapter import ChapterListItem, ChapterListRow
 
 
 class CreateStoryRequest(ApiModel):
@@ -44,7 +44,7 @@ class StoryCardResponse(ApiModel):
 
     @classmethod
     def from_story(
-        cls, story: StoryRow, chapters: List[ChapterRow]
+        cls, story: StoryRow, chapters: List[ChapterListRow]
     ) -> "StoryCardResponse":
         return cls(
             story_id=story.id,
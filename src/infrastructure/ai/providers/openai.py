@@ -18,6 +18,7 @@ class OpenAIProvider(AIProvider):
         embedding_model: str = config.ai.embedding_model,
         temperature: float = config.ai.temperature,
         max_concurrent_requests: int = config.ai.max_concurrent_requests,
+        max_concurrent_embedding_requests: int = config.ai.max_concurrent_embedding_requests,
         embeddings_batch_size: int = config.ai.embedding_batch_size,
     ):
         self.model = model
@@ -26,6 +27,7 @@ class OpenAIProvider(AIProvider):
         self.max_concurrent_requests = max_concurrent_requests
         self.temperature = temperature
         self._sem = asyncio.Semaphore(max_concurrent_requests)
+        self._embed_sem = asyncio.Semaphore(max_concurrent_embedding_requests)
 
         raw_client = AsyncOpenAI(
             base_url=settings.open_router_api_url,
@@ -181,7 +183,7 @@ class OpenAIProvider(AIProvider):
         )
 
         batched_texts = batched(texts, batch_size)
-        # We pass lists to raw embedder since it's already bounded inside our main semaphore loop
+        # We pass lists to raw embedder since it's already bounded by the embedding semaphore
         result = await asyncio.gather(
             *(self._embed_many_raw(list(batch)) for batch in batched_texts)
         )
@@ -211,14 +213,14 @@ class OpenAIProvider(AIProvider):
 
     @logfire.instrument("Provider Queue Wait: embed")
     async def embed(self, text: str) -> List[float]:
-        async with self._sem:
+        async with self._embed_sem:
             return await self._embed(text)
 
     @logfire.instrument("Provider Queue Wait: embed_many")
     async def embed_many(
         self, texts: List[str], with_batching: bool = False
     ) -> List[List[float]]:
-        async with self._sem:
+        async with self._embed_sem:
             if with_batching:
                 return await self._embed_many_batched(texts)
             return await self._embed_many_raw(texts)
@@ -77,6 +77,7 @@ class PostgresConfig(BaseModel, frozen=True):
     pool_min_size: int = 5
     pool_max_size: int = 20
     max_inactive_connection_lifetime: int = 300
+    statement_cache_size: int = 256
 
 
 class RedisConfig(BaseModel, frozen=True):
@@ -91,13 +92,16 @@ class AiConfig(BaseModel, frozen=True):
     # Lower bound 1 (no point running otherwise); upper bound 128 keeps any
     # one tick small enough that a worker crash loses little work and stays
     # well under provider per-request limits (OpenAI: 2048 inputs / ~300k
-    # tokens; Voyage/Cohere: ~96-128). Sequential DB writes mean wall-clock
-    # roughly scales linearly with this value.
+    # tokens; Voyage/Cohere: ~96-128). Embeddings are written back in a
+    # single bulk UPDATE, so DB cost barely moves with this value.
     embedding_batch_size: int = Field(default=32, ge=1, le=128)
     temperature: float = 0.0
     max_retries: int = 3
     timeout: float = 300.0
     max_concurrent_requests: int = 16
+    # Embedding calls get their own gate: they're sub-second and shouldn't
+    # queue behind long-running completions holding `max_concurrent_requests`.
+    max_concurrent_embedding_requests: int = 8
     scene_extraction_max_tokens: int = 8000
     plot_threads_max_tokens: int = 8000
     act_segmentation_max_tokens: int = 8000
@@ -51,6 +51,7 @@ async def init_pool() -> asyncpg.Pool:
         min_size=config.postgres.pool_min_size,
         max_size=config.postgres.pool_max_size,
         max_inactive_connection_lifetime=config.postgres.max_inactive_connection_lifetime,
+        statement_cache_size=config.postgres.statement_cache_size,
         init=_setup_connection,
     )
     logger.info(
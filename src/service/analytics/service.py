@@ -1,7 +1,7 @@
 from functools import cached_property
 import textwrap
 from datetime import datetime, timezone as tz, timedelta
-from typing import Literal, TYPE_CHECKING
+from typing import Literal, TYPE_CHECKING, get_args
 import redis.asyncio as aioredis
 from src.data.repositories.chapter import ChapterRepository
 from src.data.repositories.scene import SceneRepository
@@ -55,6 +55,14 @@ from src.infrastructure.ai.prompts import (
 if TYPE_CHECKING:
     from src.service.story.service import StoryService
 
+Statistic = Literal[
+    "cast", "co_occurence", "characters", "scene_lengths", "tension_pacing"
+]
+
+# Kept briefly so dashboard reloads don't re-run the aggregates; anything
+# that rewrites scenes or chapter order deletes them outright.
+STATISTICS_CACHE_TTL = timedelta(seconds=60)
+
 
 class AnalyticsService:
     prompt_map = {
@@ -170,6 +178,22 @@ class AnalyticsService:
     ) -> str:
         return f"{extraction}:{story_id}:{user_id}"
 
+    @staticmethod
+    def _get_statistics_cache_key(
+        story_id: str, user_id: str, statistic: Statistic
+    ) -> str:
+        return f"stats:{statistic}:{story_id}:{user_id}"
+
+    @staticmethod
+    def scene_cache_keys(story_id: str, user_id: str) -> list[str]:
+        """Every cached statistic, all of which are derived from a story's
+        scene rows and chapter order. Callers that rewrite scenes, publish
+        or unpublish chapters, or reorder them delete these."""
+        return [
+            AnalyticsService._get_statistics_cache_key(story_id, user_id, statistic)
+            for statistic in get_args(Statistic)
+        ]
+
     @cached_property
     def story_service(self) -> "StoryService":
         from src.service.story.service import StoryService
@@ -287,12 +311,11 @@ class AnalyticsService:
                 (
                     tension_and_pacing_curves,
                     scene_length_distribution,
-                    recent_chapter_rythm,
                 ) = await asyncio.gather(
                     self.get_tension_and_pacing_curves(story_id, user_id),
                     self.get_scene_length_distribution(story_id, user_id),
-                    self.get_recent_chapters_rythm(story_id, user_id),
                 )
+                recent_chapter_rythm = self._recent_rythm(tension_and_pacing_curves)
 
                 tension_curve_table = PrettyTable(
                     [
@@ -435,16 +458,24 @@ class AnalyticsService:
         lense: Literal["character", "plot", "structure", "world"],
         ignore_cache: bool = False,
     ) -> AnalyticsSuggestionResponse:
-        story = await self._story_repo.get(story_id, user_id)
+        cache_key = f"suggestion:{lense}:context-v2:{story_id}:{user_id}"
+
+        # A cache hit still needs the ownership check, so look both up at
+        # once. Forced refreshes (ignore_cache) skip the cache read entirely.
+        raw_data = None
+        if ignore_cache:
+            story = await self._story_repo.get(story_id, user_id)
+        else:
+            story, raw_data = await asyncio.gather(
+                self._story_repo.get(story_id, user_id),
+                self._cache.get(cache_key),
+            )
 
         if story is None:
             raise NotFoundError("Story not found")
 
-        cache_key = f"suggestion:{lense}:context-v2:{story_id}:{user_id}"
-
-        if not ignore_cache:
-            if raw_data := (await self._cache.get(cache_key)):
-                return AnalyticsSuggestionResponse.model_validate_json(raw_data)
+        if raw_data:
+            return AnalyticsSuggestionResponse.model_validate_json(raw_data)
 
         inputs = await self.get_prompt_inputs(story_id, user_id, lense)
 
@@ -486,14 +517,25 @@ class AnalyticsService:
     async def get_cast_statistics(
         self, story_id: str, user_id: str
     ) -> CastStatisticsResponse:
-        story = await self._story_repo.get(story_id, user_id)
+        cache_key = self._get_statistics_cache_key(story_id, user_id, "cast")
+
+        story, raw_data = await asyncio.gather(
+            self._story_repo.get(story_id, user_id),
+            self._cache.get(cache_key),
+        )
 
         if story is None:
             raise NotFoundError("Story not found")
 
+        if raw_data:
+            # The cached title may predate a rename; the live row wins.
+            return CastStatisticsResponse.model_validate_json(raw_data).model_copy(
+                update={"story_title": story.title}
+            )
+
         rows = await self._analytics_repo.get_cast_statistics(story_id, user_id)
 
-        return CastStatisticsResponse(
+        response = CastStatisticsResponse(
             story_id=story.id,
             story_title=story.title,
             statistics=[
@@ -504,19 +546,35 @@ class AnalyticsService:
             ],
         )
 
+        await self._cache.set(
+            cache_key, response.model_dump_json(), ex=STATISTICS_CACHE_TTL
+        )
+
+        return response
+
     async def get_co_occurence_statistics(
         self, story_id: str, user_id: str
     ) -> CoOccurenceStatisticsResponse:
-        story = await self._story_repo.get(story_id, user_id)
+        cache_key = self._get_statistics_cache_key(story_id, user_id, "co_occurence")
+
+        story, raw_data = await asyncio.gather(
+            self._story_repo.get(story_id, user_id),
+            self._cache.get(cache_key),
+        )
 
         if story is None:
             raise NotFoundError("Story not found")
 
+        if raw_data:
+            return CoOccurenceStatisticsResponse.model_validate_json(raw_data).model_copy(
+                update={"story_title": story.title}
+            )
+
         rows = await self._analytics_repo.get_character_co_occurence_statistics(
             story_id, user_id
         )
 
-        return CoOccurenceStatisticsResponse(
+        response = CoOccurenceStatisticsResponse(
             story_id=story.id,
             story_title=story.title,
             statistics=[
@@ -530,17 +588,33 @@ class AnalyticsService:
             ],
         )
 
+        await self._cache.set(
+            cache_key, response.model_dump_json(), ex=STATISTICS_CACHE_TTL
+        )
+
+        return response
+
     async def get_character_statistics(
         self, story_id: str, user_id: str
     ) -> CharacterStatisticsResponse:
-        story = await self._story_repo.get(story_id, user_id)
+        cache_key = self._get_statistics_cache_key(story_id, user_id, "characters")
+
+        story, raw_data = await asyncio.gather(
+            self._story_repo.get(story_id, user_id),
+            self._cache.get(cache_key),
+        )
 
         if story is None:
             raise NotFoundError("Story not found")
 
+        if raw_data:
+            return CharacterStatisticsResponse.model_validate_json(raw_data).model_copy(
+                update={"story_title": story.title}
+            )
+
         rows = await self._analytics_repo.get_character_statistics(story_id, user_id)
 
-        return CharacterStatisticsResponse(
+        response = CharacterStatisticsResponse(
             story_id=story.id,
             story_title=story.title,
             statistics=[
@@ -555,19 +629,35 @@ class AnalyticsService:
             ],
         )
 
+        await self._cache.set(
+            cache_key, response.model_dump_json(), ex=STATISTICS_CACHE_TTL
+        )
+
+        return response
+
     async def get_scene_length_distribution(
         self, story_id: str, user_id: str
     ) -> SceneLengthDistributionResponse:
-        story = await self._story_repo.get(story_id, user_id)
+        cache_key = self._get_statistics_cache_key(story_id, user_id, "scene_lengths")
+
+        story, raw_data = await asyncio.gather(
+            self._story_repo.get(story_id, user_id),
+            self._cache.get(cache_key),
+        )
 
         if story is None:
             raise NotFoundError("Story not found")
 
+        if raw_data:
+            return SceneLengthDistributionResponse.model_validate_json(raw_data).model_copy(
+                update={"story_title": story.title}
+            )
+
         rows = await self._analytics_repo.get_scene_length_distribution(
             story_id, user_id
         )
 
-        return SceneLengthDistributionResponse(
+        response = SceneLengthDistributionResponse(
             story_id=story.id,
             story_title=story.title,
             distribution=[
@@ -575,19 +665,35 @@ class AnalyticsService:
             ],
         )
 
+        await self._cache.set(
+            cache_key, response.model_dump_json(), ex=STATISTICS_CACHE_TTL
+        )
+
+        return response
+
     async def get_tension_and_pacing_curves(
         self, story_id: str, user_id: str
     ) -> TensionAndPacingCurveResponse:
-        story = await self._story_repo.get(story_id, user_id)
+        cache_key = self._get_statistics_cache_key(story_id, user_id, "tension_pacing")
+
+        story, raw_data = await asyncio.gather(
+            self._story_repo.get(story_id, user_id),
+            self._cache.get(cache_key),
+        )
 
         if story is None:
             raise NotFoundError("Story not found")
 
+        if raw_data:
+            return TensionAndPacingCurveResponse.model_validate_json(raw_data).model_copy(
+                update={"story_title": story.title}
+            )
+
         rows = await self._analytics_repo.get_tension_and_pacing_curves(
             story_id, user_id
         )
 
-        return TensionAndPacingCurveResponse(
+        response = TensionAndPacingCurveResponse(
             story_id=story.id,
             story_title=story.title,
             tension_curve=[
@@ -612,56 +718,60 @@ class AnalyticsService:
             ],
         )
 
+        await self._cache.set(
+            cache_key, response.model_dump_json(), ex=STATISTICS_CACHE_TTL
+        )
+
+        return response
+
     async def get_recent_chapters_rythm(
         self, story_id: str, user_id: str
     ) -> TensionAndPacingCurveResponse:
-        story = await self._story_repo.get(story_id, user_id)
-
-        if story is None:
-            raise NotFoundError("Story not found")
-
-        rows = await self._analytics_repo.get_recent_chapters_rythm(story_id, user_id)
+        return self._recent_rythm(
+            await self.get_tension_and_pacing_curves(story_id, user_id)
+        )
 
+    @staticmethod
+    def _recent_rythm(
+        curves: TensionAndPacingCurveResponse, k: int = 8
+    ) -> TensionAndPacingCurveResponse:
+        """The last `k` chapters of the full curves, most recent first. Slicing
+        the (cached) curves keeps a single query shape for both views."""
         return TensionAndPacingCurveResponse(
-            story_id=story.id,
-            story_title=story.title,
-            tension_curve=[
-                TensionCurveRow(
-                    chapter_id=row[0],
-                    chapter_number=row[1],
-                    avg_tension=row[2],
-                    scene_count=row[4],
-                    word_count=row[5],
-                )
-                for row in rows
-            ],
-            pacing_curve=[
-                PacingCurveRow(
-                    chapter_id=row[0],
-                    chapter_number=row[1],
-                    avg_pacing=row[3],
-                    scene_count=row[4],
-                    word_count=row[5],
-                )
-                for row in rows
-            ],
+            story_id=curves.story_id,
+            story_title=curves.story_title,
+            tension_curve=curves.tension_curve[::-1][:k],
+            pacing_curve=curves.pacing_curve[::-1][:k],
         )
 
     async def extract_plot_threads(
-        self, story_id: str, user_id: str, ignore_cache: bool = False
+        self,
+        story_id: str,
+        user_id: str,
+        ignore_cache: bool = False,
+        story_context: str | None = None,
     ) -> PlotThreadsResponse:
-        story = await self._story_repo.get(story_id, user_id)
+        cache_key = self._get_cache_key(story_id, user_id, "plot_threads")
+
+        raw_data = None
+        if ignore_cache:
+            story = await self._story_repo.get(story_id, user_id)
+        else:
+            story, raw_data = await asyncio.gather(
+                self._story_repo.get(story_id, user_id),
+                self._cache.get(cache_key),
+            )
 
         if story is None:
             raise NotFoundError("Story not found")
 
-        cache_key = self._get_cache_key(story_id, user_id, "plot_threads")
-
-        if not ignore_cache:
-            if raw_data := (await self._cache.get(cache_key)):
-                return PlotThreadsResponse.model_validate_json(raw_data)
+        if raw_data:
+            return PlotThreadsResponse.model_validate_json(raw_data)
 
-        story_context = await self.story_service.get_story_context(user_id, story_id)
+        if story_context is None:
+            story_context = await self.story_service.get_story_context(
+                user_id, story_id
+            )
 
         extraction = await self._provider.extract(
             system_prompt=PLOT_THREADS_EXTRACTION_PROMPT,
@@ -689,20 +799,33 @@ class AnalyticsService:
         return response
 
     async def extract_acts(
-        self, story_id: str, user_id: str, ignore_cache: bool = False
+        self,
+        story_id: str,
+        user_id: str,
+        ignore_cache: bool = False,
+        story_context: str | None = None,
     ) -> ActSegmentationResponse:
-        story = await self._story_repo.get(story_id, user_id)
+        cache_key = self._get_cache_key(story_id, user_id, "act_segmentation")
+
+        raw_data = None
+        if ignore_cache:
+            story = await self._story_repo.get(story_id, user_id)
+        else:
+            story, raw_data = await asyncio.gather(
+                self._story_repo.get(story_id, user_id),
+                self._cache.get(cache_key),
+            )
 
         if story is None:
             raise NotFoundError("Story not found")
 
-        cache_key = self._get_cache_key(story_id, user_id, "act_segmentation")
-
-        if not ignore_cache:
-            if raw_data := (await self._cache.get(cache_key)):
-                return ActSegmentationResponse.model_validate_json(raw_data)
+        if raw_data:
+            return ActSegmentationResponse.model_validate_json(raw_data)
 
-        story_context = await self.story_service.get_story_context(user_id, story_id)
+        if story_context is None:
+            story_context = await self.story_service.get_story_context(
+                user_id, story_id
+            )
 
         extraction = await self._provider.extract(
             system_prompt=self._with_story_status(ACT_SEGMENTATION_EXTRACTION_PROMPT, story.status),
@@ -730,20 +853,33 @@ class AnalyticsService:
         return response
 
     async def extract_contradictions(
-        self, story_id: str, user_id: str, ignore_cache: bool = False
+        self,
+        story_id: str,
+        user_id: str,
+        ignore_cache: bool = False,
+        story_context: str | None = None,
     ) -> ContradictionResponse:
-        story = await self._story_repo.get(story_id, user_id)
+        cache_key = self._get_cache_key(story_id, user_id, "contradictions")
+
+        raw_data = None
+        if ignore_cache:
+            story = await self._story_repo.get(story_id, user_id)
+        else:
+            story, raw_data = await asyncio.gather(
+                self._story_repo.get(story_id, user_id),
+                self._cache.get(cache_key),
+            )
 
         if story is None:
             raise NotFoundError("Story not found")
 
-        cache_key = self._get_cache_key(story_id, user_id, "contradictions")
-
-        if not ignore_cache:
-            if raw_data := (await self._cache.get(cache_key)):
-                return ContradictionResponse.model_validate_json(raw_data)
+        if raw_data:
+            return ContradictionResponse.model_validate_json(raw_data)
 
-        story_context = await self.story_service.get_story_context(user_id, story_id)
+        if story_context is None:
+            story_context = await self.story_service.get_story_context(
+                user_id, story_id
+            )
 
         extraction = await self._provider.extract(
             system_prompt=CONTRADICTION_EXTRACTION_PROMPT,
@@ -771,20 +907,33 @@ class AnalyticsService:
         return response
 
     async def extract_entities(
-        self, story_id: str, user_id: str, ignore_cache: bool = False
+        self,
+        story_id: str,
+        user_id: str,
+        ignore_cache: bool = False,
+        story_context: str | None = None,
     ) -> EntityLedgerResponse:
-        story = await self._story_repo.get(story_id, user_id)
+        cache_key = self._get_cache_key(story_id, user_id, "entities")
+
+        raw_data = None
+        if ignore_cache:
+            story = await self._story_repo.get(story_id, user_id)
+        else:
+            story, raw_data = await asyncio.gather(
+                self._story_repo.get(story_id, user_id),
+                self._cache.get(cache_key),
+            )
 
         if story is None:
             raise NotFoundError("Story not found")
 
-        cache_key = self._get_cache_key(story_id, user_id, "entities")
-
-        if not ignore_cache:
-            if raw_data := (await self._cache.get(cache_key)):
-                return EntityLedgerResponse.model_validate_json(raw_data)
+        if raw_data:
+            return EntityLedgerResponse.model_validate_json(raw_data)
 
-        story_context = await self.story_service.get_story_context(user_id, story_id)
+        if story_context is None:
+            story_context = await self.story_service.get_story_context(
+                user_id, story_id
+            )
 
         extraction = await self._provider.extract(
             system_prompt=ENTITY_LEDGER_EXTRACTION_PROMPT,
@@ -855,12 +1004,11 @@ class AnalyticsService:
         (
             tension_and_pacing_curves,
             scene_length_distribution,
-            recent_rythm,
         ) = await asyncio.gather(
             self.get_tension_and_pacing_curves(story_id, user_id),
             self.get_scene_length_distribution(story_id, user_id),
-            self.get_recent_chapters_rythm(story_id, user_id),
         )
+        recent_rythm = self._recent_rythm(tension_and_pacing_curves)
 
         suggestion = await self.get_analytics_suggestion(story_id, user_id, "structure")
 
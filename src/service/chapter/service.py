@@ -1,4 +1,5 @@
 from __future__ import annotations
+import asyncio
 import textwrap
 from typing import TYPE_CHECKING, List, Optional, Union
 
@@ -24,6 +25,7 @@ from src.data.schemas.chapter import ChapterSummaryResponse
 from src.data.schemas.enums import StoryStatus
 from src.data.schemas.extraction import CommentExtraction, CommentExtractionResponse
 from src.data.schemas.scene import SceneRow
+from src.data.schemas.story import StoryRow
 from src.infrastructure.config import config
 from src.infrastructure.ai.prompts import COMMENTS_EXTRACTION_PROMPT, COMMENTS_PLANNER_PROMPT, SUMMARIZATION_PROMPT
 from src.infrastructure.ai.providers.protocol import AIProvider
@@ -38,6 +40,7 @@ from src.shared.utils.html import (
     get_similarity_ratio,
     get_preview_content,
     get_word_count,
+    get_word_count_and_plain_text,
     html_to_plain_text,
 )
 from src.service.utils.decorators import retry_enqueue
@@ -74,7 +77,9 @@ class ChapterService:
     def extraction_service(self) -> "ExtractionService":
         from src.service.extraction.service import ExtractionService
 
-        return ExtractionService(self._provider, self._chapter_repo, self._scene_repo)
+        return ExtractionService(
+            self._provider, self._chapter_repo, self._scene_repo, self._cache
+        )
 
     @cached_property
     def embedding_service(self) -> "EmbeddingService":
@@ -165,43 +170,39 @@ class ChapterService:
         if not story.path_array or not results:
             return ChapterListResponse.from_story(story, [])
 
-        chapters = [result[0] for result in results]
-
-        lookup = {c.id: c for c in chapters}
-
-        # Explicit mapping loop: reading direct properties from the database object
-        items = []
-        for i, cid in enumerate(story.path_array):
-            if cid in lookup:
-                row = lookup[cid]
-                item = ChapterListItem(
-                    story_id=row.story_id,
-                    chapter_id=row.id,  # Manually mapping 'id' to 'chapter_id'
-                    chapter_number=i + 1,
-                    word_count=row.word_count,
-                    story_title=story.title,
-                    chapter_title=row.title,
-                    published=row.published,
-                    updated_at=row.updated_at,
-                )
-                items.append(item)
+        items = [
+            ChapterListItem(
+                story_id=row.story_id,
+                chapter_id=row.id,  # Manually mapping 'id' to 'chapter_id'
+                chapter_number=chapter_number,
+                word_count=row.word_count,
+                story_title=story.title,
+                chapter_title=row.title,
+                published=row.published,
+                updated_at=row.updated_at,
+            )
+            for row, _, chapter_number in results
+            if chapter_number is not None
+        ]
 
         return ChapterListResponse.from_story(story, items)
 
     # ─── writes (transactional) ────────────────────────────────────────────
-    @handle_service_errors
     async def _invalidate_chapter_analysis(
         self,
         chapter_id: str,
         story_id: str,
         user_id: str
     ) -> None:
+        from src.service.analytics.service import AnalyticsService
+
         await self._cache.delete(
             f"chapter:baseline:{chapter_id}",
             f"chapter:extraction-pending:{chapter_id}",
             f"chapter:editorial_plan:{user_id}:{chapter_id}",
             f"summary:{chapter_id}:{user_id}",
             f"chapter:comments:{chapter_id}",
+            *AnalyticsService.scene_cache_keys(story_id, user_id),
             f"pulse:{story_id}:{user_id}",
             f"plot_threads:{story_id}:{user_id}",
             f"act_segmentation:{story_id}:{user_id}",
@@ -213,23 +214,25 @@ class ChapterService:
             f"suggestion:world:context-v2:{story_id}:{user_id}"
         )
 
-    @handle_service_errors
     async def _on_chapter_reorder(
         self,
-        story_id: str,
+        story: StoryRow,
         user_id: str,
         from_pos: int,
         to_pos: int
     ) -> None:
-         story = await self._story_repo.get(story_id, user_id)
-
-         if story is None:
-            raise NotFoundError("Story not found")
+         # `story` is the row loaded before the reorder. Moving a chapter only
+         # permutes positions within [min(from, to), max(from, to)], so the
+         # set of ids from `start` onwards is the same before and after.
+         story_id = story.id
 
          if story.path_array is None:
             return
 
+         from src.service.analytics.service import AnalyticsService
+
          await self._cache.delete(
+            *AnalyticsService.scene_cache_keys(story_id, user_id),
             f"pulse:{story_id}:{user_id}",
             f"plot_threads:{story_id}:{user_id}",
             f"act_segmentation:{story_id}:{user_id}",
@@ -244,20 +247,19 @@ class ChapterService:
          start = min(from_pos, to_pos)
 
          affected_chapter_ids = story.path_array[start:]
-         affected_chapters = await self._chapter_repo.list_by_ids(affected_chapter_ids)
-
-         for chapter in affected_chapters:
+         published_chapter_ids = await self._chapter_repo.list_published_ids(
+             affected_chapter_ids
+         )
 
-              if not chapter.published:
-                  continue
+         for chapter_id in published_chapter_ids:
 
               await self._cache.delete(
-                   f"summary:{chapter.id}:{user_id}",
-                   f"chapter:editorial_plan:{user_id}:{chapter.id}",
-                   f"chapter:comments:{chapter.id}"
+                   f"summary:{chapter_id}:{user_id}",
+                   f"chapter:editorial_plan:{user_id}:{chapter_id}",
+                   f"chapter:comments:{chapter_id}"
                )
 
-              pending_key = f"chapter:chapter-reanalysis-pending:{chapter.id}"
+              pending_key = f"chapter:chapter-reanalysis-pending:{chapter_id}"
 
               claimed = await self._cache.set(
                   pending_key,
@@ -272,7 +274,7 @@ class ChapterService:
                         "chapter_reanalysis_job",
                         story_id=story_id,
                         user_id=user_id,
-                        chapter_id=chapter.id,
+                        chapter_id=chapter_id,
                         timeout=900,
                     )
                 except Exception:
@@ -434,13 +436,23 @@ class ChapterService:
             )
 
         chapter, story_title, chapter_number = triple
-        fields = data.model_dump(exclude_unset=True)
+        # Autosave re-sends the whole payload; only write columns that
+        # actually changed so an unchanged chapter body isn't shipped back to
+        # Postgres (or re-parsed for word count) on every save.
+        fields = {
+            key: value
+            for key, value in data.model_dump(exclude_unset=True).items()
+            if getattr(chapter, key) != value
+        }
 
         plain_text: str | None = None
 
         if "content" in fields:
-            fields["word_count"] = get_word_count(fields["content"])
-            plain_text = html_to_plain_text(fields["content"])
+            # BeautifulSoup parsing is pure CPU and scales with chapter size;
+            # run it off the event loop so concurrent requests keep moving.
+            fields["word_count"], plain_text = await asyncio.to_thread(
+                get_word_count_and_plain_text, fields["content"]
+            )
 
         async with self._chapter_repo.pool.acquire() as conn:
             async with conn.transaction():
@@ -466,18 +478,38 @@ class ChapterService:
         analysis_content = (
             plain_text
             if plain_text is not None
-            else html_to_plain_text(updated.content or "")
+            else await asyncio.to_thread(html_to_plain_text, updated.content or "")
         )
 
 
-        if became_published and updated.word_count >= 1000:
-            await self.queue_extraction_job(
-                chapter_id,
-                chapter.story_id,
-                chapter.user_id,
-                analysis_content
+        if became_published:
+            from src.service.analytics.service import AnalyticsService
+
+            # Statistics only count published chapters, so any scenes this
+            # chapter already has start counting now.
+            await self._cache.delete(
+                *AnalyticsService.scene_cache_keys(chapter.story_id, chapter.user_id)
             )
 
+        if became_published and updated.word_count >= 1000:
+            from src.service.extraction.service import content_hash
+
+            # Republishing the exact text the current scenes came from (a
+            # draft round-trip with no edits) has nothing new to extract.
+            if chapter.scenes_content_hash != content_hash(analysis_content):
+                await self.queue_extraction_job(
+                    chapter_id,
+                    chapter.story_id,
+                    chapter.user_id,
+                    analysis_content
+                )
+            else:
+                # The job would have re-seeded the edit baseline that going
+                # to draft dropped.
+                await self._cache.set(
+                    f"chapter:baseline:{chapter_id}", analysis_content
+                )
+
         if became_draft:
             await self._invalidate_chapter_analysis(
                 chapter_id,
@@ -495,12 +527,15 @@ class ChapterService:
             if baseline is None:
                 should_extract = updated.word_count >= 1000
             else:
+                # SequenceMatcher(autojunk=False) is quadratic-ish on long
+                # chapters — keep it off the event loop.
                 should_extract = (
-                    get_similarity_ratio(
-                        baseline.decode() if isinstance(baseline, bytes) else baseline, 
-                        plain_text
-                    ) < self.REEXTRACTION_THRESHOLD
-                )
+                    await asyncio.to_thread(
+                        get_similarity_ratio,
+                        baseline.decode() if isinstance(baseline, bytes) else baseline,
+                        plain_text,
+                    )
+                ) < self.REEXTRACTION_THRESHOLD
 
             if should_extract:
                 await self.queue_extraction_job(
@@ -594,7 +629,7 @@ class ChapterService:
                         conn=conn,
                     )
 
-            await self._on_chapter_reorder(story_id, user_id, data.from_pos, data.to_pos)
+            await self._on_chapter_reorder(story, user_id, data.from_pos, data.to_pos)
 
         except Exception as e:
             logger.error(
@@ -621,7 +656,8 @@ class ChapterService:
     # Operate purely on `path_array` (the ordering source of truth) and the
     # `prev_chapter_id`/`next_chapter_id` pointers (derived from it). All take
     # an optional `conn` so the public method can compose them into a single
-    # transaction.
+    # transaction. Writing the path also bumps the story's `updated_at`, so a
+    # separate touch is only issued when the path is left as it was.
 
     async def _append_chapter_to_path_end(
         self,
@@ -629,19 +665,13 @@ class ChapterService:
         chapter_id: str,
         *,
         conn: asyncpg.Connection | None = None,
-    ) -> None:
-        path = await self._story_repo.get_path_array(story_id, executor=conn)
+    ) -> list[str]:
+        path = await self._story_repo.append_to_path(
+            story_id, chapter_id, executor=conn
+        )
         if path is None:
             raise ValueError(f"Story {story_id} not found")
-
-        if chapter_id in path:
-            return
-
-        await self._story_repo.set_path_array(
-            story_id,
-            [*path, chapter_id],
-            executor=conn,
-        )
+        return path
 
     async def _remove_chapter_from_path(
         self,
@@ -649,16 +679,19 @@ class ChapterService:
         chapter_id: str,
         *,
         conn: asyncpg.Connection | None = None,
-    ) -> None:
+    ) -> list[str] | None:
         path = await self._story_repo.get_path_array(story_id, executor=conn)
-        if not path or chapter_id not in path:
-            return
+        if path:
+            try:
+                path.remove(chapter_id)
+            except ValueError:
+                pass
+            else:
+                await self._story_repo.set_path_array(story_id, path, executor=conn)
+                return path
 
-        await self._story_repo.set_path_array(
-            story_id,
-            [c for c in path if c != chapter_id],
-            executor=conn,
-        )
+        await self._update_story_timestamp(story_id, conn=conn)
+        return path
 
     async def _reorder_chapter_path(
         self,
@@ -667,28 +700,33 @@ class ChapterService:
         to_pos: int,
         *,
         conn: asyncpg.Connection | None = None,
-    ) -> None:
+    ) -> list[str] | None:
         path = await self._story_repo.get_path_array(story_id, executor=conn)
-        if not path:
-            return
+        last = len(path) - 1 if path else -1
+        if (
+            path
+            and from_pos != to_pos
+            and 0 <= from_pos <= last
+            and 0 <= to_pos <= last
+        ):
+            path.insert(to_pos, path.pop(from_pos))
+            await self._story_repo.set_path_array(story_id, path, executor=conn)
+            return path
 
-        last = len(path) - 1
-        if not (0 <= from_pos <= last) or not (0 <= to_pos <= last):
-            return
-        if from_pos == to_pos:
-            return
-
-        new_path = list(path)
-        new_path.insert(to_pos, new_path.pop(from_pos))
-        await self._story_repo.set_path_array(story_id, new_path, executor=conn)
+        await self._update_story_timestamp(story_id, conn=conn)
+        return path
 
     async def _sync_all_chapter_pointers(
         self,
         story_id: str,
+        path: list[str] | None = None,
         *,
         conn: asyncpg.Connection | None = None,
     ) -> None:
-        path = await self._story_repo.get_path_array(story_id, executor=conn)
+        """Re-derive prev/next pointers from `path`. Callers that just wrote
+        the path pass it through; otherwise it's read from the story."""
+        if path is None:
+            path = await self._story_repo.get_path_array(story_id, executor=conn)
         if path is None:
             return
         await self._chapter_repo.sync_pointers(story_id, path, executor=conn)
@@ -710,10 +748,9 @@ class ChapterService:
         *,
         conn: asyncpg.Connection | None = None,
     ) -> None:
-        await self._append_chapter_to_path_end(story_id, chapter_id, conn=conn)
-        await self._sync_all_chapter_pointers(story_id, conn=conn)
-        await self._update_story_timestamp(story_id, conn=conn)
-        logger.info(
+        path = await self._append_chapter_to_path_end(story_id, chapter_id, conn=conn)
+        await self._sync_all_chapter_pointers(story_id, path, conn=conn)
+        logger.debug(
             "chapter.path_created",
             chapter_id=chapter_id,
             story_id=story_id,
@@ -726,10 +763,9 @@ class ChapterService:
         *,
         conn: asyncpg.Connection | None = None,
     ) -> None:
-        await self._remove_chapter_from_path(story_id, chapter_id, conn=conn)
-        await self._sync_all_chapter_pointers(story_id, conn=conn)
-        await self._update_story_timestamp(story_id, conn=conn)
-        logger.info(
+        path = await self._remove_chapter_from_path(story_id, chapter_id, conn=conn)
+        await self._sync_all_chapter_pointers(story_id, path, conn=conn)
+        logger.debug(
             "chapter.path_deleted",
             chapter_id=chapter_id,
             story_id=story_id,
@@ -743,10 +779,11 @@ class ChapterService:
         *,
         conn: asyncpg.Connection | None = None,
     ) -> None:
-        await self._reorder_chapter_path(story_id, from_pos, to_pos, conn=conn)
-        await self._sync_all_chapter_pointers(story_id, conn=conn)
-        await self._update_story_timestamp(story_id, conn=conn)
-        logger.info(
+        path = await self._reorder_chapter_path(
+            story_id, from_pos, to_pos, conn=conn
+        )
+        await self._sync_all_chapter_pointers(story_id, path, conn=conn)
+        logger.debug(
             "chapter.path_reordered",
             story_id=story_id,
             from_pos=from_pos,
@@ -782,17 +819,18 @@ class ChapterService:
     async def get_story_context(
         self, user_id: str, story_id: str, chapter_id: Optional[str] = None
     ) -> str:
-        scenes = await self._scene_repo.list_by_story(
-            story_id=story_id, user_id=user_id, chapter_id=chapter_id
+        # Scenes come back in reading order; the path is only fetched to
+        # tell a missing story apart from one with no scenes yet.
+        scenes, path_array = await asyncio.gather(
+            self._scene_repo.list_by_story(
+                story_id=story_id, user_id=user_id, chapter_id=chapter_id
+            ),
+            self._story_repo.get_path_array(story_id),
         )
 
-        path_array = await self._story_repo.get_path_array(story_id)
-
         if path_array is None:
             raise NotFoundError("Story not found")
 
-        scenes = sorted(scenes, key=lambda scene: path_array.index(scene.chapter_id))
-
         story_ctx = self._format_scenes(scenes)
 
         return story_ctx
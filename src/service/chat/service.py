@@ -195,14 +195,15 @@ class ChatService:
 
         async with self._chat_repo.pool.acquire() as conn:
             async with conn.transaction():
-                for msg, dumped in zip(new_messages, serialized, strict=True):
-                    await self._chat_repo.append_message(
-                        thread_id=payload.thread_id,
-                        user_id=user_id,
-                        kind=msg.kind,
-                        message=dumped,
-                        executor=conn,
-                    )
+                await self._chat_repo.append_messages(
+                    thread_id=payload.thread_id,
+                    user_id=user_id,
+                    messages=[
+                        (msg.kind, dumped)
+                        for msg, dumped in zip(new_messages, serialized, strict=True)
+                    ],
+                    executor=conn,
+                )
                 await self._chat_repo.touch_thread(
                     payload.thread_id, user_id, executor=conn
                 )
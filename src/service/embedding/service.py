@@ -21,6 +21,25 @@ class EmbeddingService:
         {" ".join(row.mentioned_entities)}
         """
 
+    async def _write_embeddings(
+        self, scenes: List[SceneRow], embeddings: List[List[float]]
+    ) -> int:
+        """Write the whole batch back in one statement. A failure is logged
+        and reported as zero updated — the scenes keep `embedding IS NULL`
+        and the embedding cron picks them up on its next tick."""
+        try:
+            return await self._scene_repo.update_embeddings(
+                embeddings=[(scene.id, emb) for scene, emb in zip(scenes, embeddings)],
+                embedding_model=self._provider.embedding_model,
+            )
+        except Exception as e:
+            logger.warning(
+                "update_embeddings.failed",
+                scene_count=len(scenes),
+                error=str(e),
+            )
+            return 0
+
     async def embed_scenes(self, chapter_id: str) -> None:
         scenes: List[SceneRow] = await self._scene_repo.list_by_chapter(chapter_id)
 
@@ -36,22 +55,7 @@ class EmbeddingService:
             )
             raise ServiceError("AI provider returned malformed embedding batch.")
 
-            # update embeddings
-        updated = 0
-        for scene, embedding in zip(scenes, embeddings):
-            try:
-                await self._scene_repo.update_embedding(
-                    scene_id=scene.id,
-                    embedding=embedding,
-                    embedding_model=self._provider.embedding_model,
-                )
-                updated += 1
-            except Exception as e:
-                logger.warning(
-                    "update_embedding.failed",
-                    scene_id=scene.id,
-                    error=str(e),
-                )
+        updated = await self._write_embeddings(scenes, embeddings)
 
         logger.info(
             "embed_pending_batched.complete",
@@ -90,21 +94,7 @@ class EmbeddingService:
             raise ServiceError("AI provider returned malformed embedding batch.")
 
         # update embeddings
-        updated = 0
-        for scene, embedding in zip(scenes_to_embed, embeddings):
-            try:
-                await self._scene_repo.update_embedding(
-                    scene_id=scene.id,
-                    embedding=embedding,
-                    embedding_model=self._provider.embedding_model,
-                )
-                updated += 1
-            except Exception as e:
-                logger.warning(
-                    "update_embedding.failed",
-                    scene_id=scene.id,
-                    error=str(e),
-                )
+        updated = await self._write_embeddings(scenes_to_embed, embeddings)
 
         logger.info(
             "embed_pending_batched.complete",
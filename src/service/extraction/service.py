@@ -7,9 +7,12 @@ ExtractionService:
       3. Atomically replace this chapter's scene rows AND clear the staleness
          flag on the chapter — both inside one transaction so a crash mid-write
          can't leave half-extracted state behind.
+      4. Drop the statistics cached from the old scenes.
   - regenerate_stale_batched(batch_size):
       Sweep stale chapters (oldest first), in batches, calling extract_scenes
-      per chapter. Failures are logged and skipped — the batch continues.
+      per chapter. Chapters whose text hashes the same as when their scenes
+      were extracted are just un-flagged. Failures are logged and skipped —
+      the batch continues.
 
 scenes_are_stale (module-level):
   Pure function. Given a list of Scenes (already in the DB) and the chapter's
@@ -19,16 +22,19 @@ scenes_are_stale (module-level):
 """
 
 import asyncio
+import hashlib
 from itertools import batched
 from typing import Any, Iterable, Optional
 
 from loguru import logger
+import redis.asyncio as aioredis
 
 from src.data.repositories import ChapterRepository, SceneRepository
 from src.data.schemas import SceneExtraction
 from src.data.schemas.extraction import SceneExtractionResult
 from src.infrastructure.ai import AIProvider, SCENE_EXTRACTION_PROMPT
 from src.infrastructure.config import config
+from src.service.analytics.service import AnalyticsService
 from src.service.exceptions import InternalError, NotFoundError
 from src.service.utils.decorators import handle_service_errors
 from src.shared.utils.html import html_to_plain_text
@@ -46,6 +52,11 @@ def scenes_are_stale(scenes: Iterable[Any], chapter_content: str) -> bool:
     return False
 
 
+def content_hash(plain_text: str) -> str:
+    """Fingerprint of the exact text an extraction ran on."""
+    return hashlib.sha256(plain_text.encode()).hexdigest()
+
+
 class ExtractionService:
     MIN_SCENE_EXTRACTION_WORDS = 1000
 
@@ -54,10 +65,19 @@ class ExtractionService:
         provider: AIProvider,
         chapter_repo: ChapterRepository,
         scene_repo: SceneRepository,
+        redis: aioredis.Redis,
     ) -> None:
         self._provider = provider
         self._chapter_repo = chapter_repo
         self._scene_repo = scene_repo
+        self._cache = redis
+
+    async def _invalidate_scene_caches(self, story_id: str, user_id: str) -> None:
+        # Done here rather than by callers so every path that rewrites a
+        # chapter's scenes (SAQ job, stale sweep) drops the derived caches.
+        await self._cache.delete(
+            *AnalyticsService.scene_cache_keys(story_id, user_id)
+        )
 
     def _validate_extraction(
         self,
@@ -121,7 +141,11 @@ class ExtractionService:
 
     @handle_service_errors
     async def extract_scenes(
-        self, chapter_id: str, user_id: str, content: str | None = None
+        self,
+        chapter_id: str,
+        user_id: str,
+        content: str | None = None,
+        skip_if_unchanged: bool = False,
     ) -> Optional[SceneExtractionResult]:
 
         result =  await self._chapter_repo.get_with_story_title(chapter_id, user_id)
@@ -137,6 +161,17 @@ class ExtractionService:
             else html_to_plain_text(chapter.content or "")
         )
 
+        text_hash = content_hash(plain_text)
+
+        if skip_if_unchanged and chapter.scenes_content_hash == text_hash:
+            # A stale flag doesn't guarantee the text changed. If it is exactly
+            # what the current scenes were extracted from, clear the flag and
+            # skip the LLM call plus the delete+reinsert (which would also
+            # throw away the embeddings).
+            await self._scene_repo.mark_chapter_extracted(chapter.id, text_hash)
+            logger.info("extract_scenes.skipped_unchanged", chapter_id=chapter.id)
+            return None
+
         if len(plain_text.split()) < self.MIN_SCENE_EXTRACTION_WORDS:
             async with self._scene_repo.pool.acquire() as conn:
                 async with conn.transaction():
@@ -148,8 +183,9 @@ class ExtractionService:
                         executor=conn,
                     )
                     await self._scene_repo.mark_chapter_extracted(
-                        chapter.id, executor=conn
+                        chapter.id, text_hash, executor=conn
                     )
+            await self._invalidate_scene_caches(chapter.story_id, chapter.user_id)
             return None
 
         extraction = await self._extract_with_feedback(chapter_content=plain_text)
@@ -165,9 +201,11 @@ class ExtractionService:
                 )
                 await self._scene_repo.mark_chapter_extracted(
                     chapter.id,
+                    text_hash,
                     executor=conn,
                 )
-        
+        await self._invalidate_scene_caches(chapter.story_id, chapter.user_id)
+
         return SceneExtractionResult(
             scenes_extracted=len(extraction.scenes),
             chapter_number=chapter_number,
@@ -183,17 +221,20 @@ class ExtractionService:
         logged and skipped."""
         total_reextracted = 0
 
-        stale_chapter_ids, user_id = await self._scene_repo.list_stale_chapter_ids(
+        stale_chapters = await self._scene_repo.list_stale_chapter_ids(
             window_seconds=config.jobs.scene_extraction_window_seconds,
             limit=4 * batch_size,
         )
 
-        for batch in batched(stale_chapter_ids, batch_size):
+        for batch in batched(stale_chapters, batch_size):
             results = await asyncio.gather(
-                *(self.extract_scenes(cid, user_id) for cid in batch),
+                *(
+                    self.extract_scenes(cid, uid, skip_if_unchanged=True)
+                    for cid, uid in batch
+                ),
                 return_exceptions=True,
             )
-            for cid, result in zip(batch, results):
+            for (cid, _), result in zip(batch, results):
                 if isinstance(result, Exception):
                     logger.warning(
                         "extract_scenes.failed",
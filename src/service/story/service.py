@@ -187,8 +187,6 @@ class StoryService:
 
         results = await self._chapter_repo.list_by_story(story_id, user_id)
 
-        results = sorted(results, key=lambda x: x[2])
-
         chapter_items = [
             ChapterListItem(
                 story_id=c.story_id,
@@ -201,6 +199,7 @@ class StoryService:
                 updated_at=c.updated_at,
             )
             for c, story_title, chapter_number in results
+            if chapter_number is not None
         ]
 
         return StoryDetailResponse.from_story(story, chapter_items)
@@ -267,7 +266,8 @@ class StoryService:
             else self._search_config.default_candidate_pool
         )
 
-        logger.info(
+        # Echoes the filter payload; only useful when tracing a single query.
+        logger.debug(
             "story.search.start",
             user_id=user_id,
             story_id=story_id,
@@ -298,19 +298,16 @@ class StoryService:
             candidate_pool=candidate_pool,
         )
 
-        logger.info(
-            "story.search.done",
-            user_id=user_id,
-            story_id=story_id,
-            query_len=len(query_text),
-            results=len(search_results),
-        )
+        chapter_numbers = {
+            chapter_id: chapter_number
+            for chapter_number, chapter_id in enumerate(story_path_array, start=1)
+        }
 
         return [
             SceneSearchResponse(
                 id=result.id,
                 chapter_id=result.chapter_id,
-                chapter_number=story_path_array.index(result.chapter_id) + 1,
+                chapter_number=chapter_numbers[result.chapter_id],
                 story_id=result.story_id,
                 title=result.title,
                 description=result.description,
@@ -383,10 +380,7 @@ class StoryService:
             for chapter_number, chapter_id in enumerate(path_array, start=1)
         }
 
-        for scene in sorted(
-            scenes,
-            key=lambda scene: (chapter_numbers[scene.chapter_id], scene.position),
-        ):
+        for scene in scenes:
             header = f"""\
             CHAPTER NUMBER: {chapter_numbers[scene.chapter_id]}
             SCENE NUMBER WITHIN CHAPTER: {scene.position + 1}
@@ -450,7 +444,11 @@ class StoryService:
 
     @handle_service_errors
     async def get_pulse(
-        self, user_id: str, story_id: str, ignore_cache: bool = False
+        self,
+        user_id: str,
+        story_id: str,
+        ignore_cache: bool = False,
+        story_context: Optional[str] = None,
     ) -> BookPulseResponse:
         story = await self._story_repo.get(story_id, user_id)
 
@@ -463,8 +461,12 @@ class StoryService:
             if raw_data := (await self._cache.get(cache_key)):
                 return BookPulseResponse.model_validate_json(raw_data)
 
-        # get story_context
-        story_ctx = await self.get_story_context(user_id, story_id)
+        # Worker fan-outs build the context once and hand it to every pass.
+        story_ctx = (
+            story_context
+            if story_context is not None
+            else await self.get_story_context(user_id, story_id)
+        )
 
         if story_ctx == "NOT_ENOUGH_CONTEXT":
             return INSUFFICIENT_CONTEXT
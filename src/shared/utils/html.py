@@ -1,14 +1,24 @@
 # src/shared/utils/html.py
 
 from bs4 import BeautifulSoup
-from typing import List
+from typing import List, Optional
 import difflib
 
+# Block-level tags that get a trailing newline in previews. Built once at
+# import rather than on every call.
+_BLOCK_ELEMENTS = (
+    "p", "div", "br", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "pre",
+    "ul", "ol", "li", "table", "tr", "td", "th", "article", "section",
+    "header", "footer", "nav", "aside", "hr", "address", "figure",
+    "figcaption",
+)
 
-def get_word_count(html: str) -> int:
-    """Get word count from TipTap Editor"""
+
+def _clean_soup(html: str) -> Optional[BeautifulSoup]:
+    """Parse TipTap HTML with script and style tags removed, or None when
+    there is nothing to parse."""
     if not html or html.strip() == "":
-        return 0
+        return None
 
     soup = BeautifulSoup(html, "html.parser")
 
@@ -16,11 +26,42 @@ def get_word_count(html: str) -> int:
     for script in soup(["script", "style"]):
         script.decompose()
 
-    plain_text = soup.get_text()
+    return soup
+
+
+def _soup_paragraphs(soup: BeautifulSoup) -> List[str]:
+    """Non-empty plain-text paragraphs. TipTap uses <p> tags for paragraphs."""
+    paragraphs = []
+    for p_tag in soup.find_all("p"):
+        text = p_tag.get_text(separator=" ", strip=True)
+        if text:
+            paragraphs.append(text)
+    return paragraphs
+
+
+def get_word_count(html: str) -> int:
+    """Get word count from TipTap Editor"""
+    soup = _clean_soup(html)
+    if soup is None:
+        return 0
 
     # Clean whitespace and count
-    words = plain_text.split()
-    return len(words)
+    return len(soup.get_text().split())
+
+
+def get_word_count_and_plain_text(html: str) -> tuple[int, str]:
+    """
+    Word count and plain text from a single parse.
+
+    Same results as get_word_count and html_to_plain_text, for callers
+    (chapter saves) that need both and shouldn't parse the HTML twice.
+    """
+    soup = _clean_soup(html)
+    if soup is None:
+        return 0, ""
+
+    word_count = len(soup.get_text().split())
+    return word_count, "\n\n".join(_soup_paragraphs(soup))
 
 
 def get_similarity_ratio(text_a: str, text_b: str) -> float:
@@ -41,48 +82,12 @@ def get_preview_content(html: str) -> str:
     USE FOR: Display previews in UI
     DON'T USE FOR: AI processing (use html_to_plain_text instead)
     """
-    if not html or html.strip() == "":
+    soup = _clean_soup(html)
+    if soup is None:
         return ""
 
-    soup = BeautifulSoup(html, "html.parser")
-
-    # Remove script and style tags
-    for script in soup(["script", "style"]):
-        script.decompose()
-
     # Add newlines after block elements before getting text
-    block_elements = [
-        "p",
-        "div",
-        "br",
-        "h1",
-        "h2",
-        "h3",
-        "h4",
-        "h5",
-        "h6",
-        "blockquote",
-        "pre",
-        "ul",
-        "ol",
-        "li",
-        "table",
-        "tr",
-        "td",
-        "th",
-        "article",
-        "section",
-        "header",
-        "footer",
-        "nav",
-        "aside",
-        "hr",
-        "address",
-        "figure",
-        "figcaption",
-    ]
-
-    for element in soup.find_all(block_elements):
+    for element in soup.find_all(_BLOCK_ELEMENTS):
         element.append("\n")
 
     plain_text = soup.get_text()
@@ -120,24 +125,11 @@ def html_to_plain_text(html: str) -> str:
         Input: '<p>First para</p><p>Second para</p>'
         Output: 'First para\\n\\nSecond para'
     """
-    if not html or html.strip() == "":
+    soup = _clean_soup(html)
+    if soup is None:
         return ""
 
-    soup = BeautifulSoup(html, "html.parser")
-
-    # Remove script and style tags
-    for script in soup(["script", "style"]):
-        script.decompose()
-
-    paragraphs = []
-
-    # TipTap uses <p> tags for paragraphs
-    for p_tag in soup.find_all("p"):
-        text = p_tag.get_text(separator=" ", strip=True)
-        if text:
-            paragraphs.append(text)
-
-    return "\n\n".join(paragraphs)
+    return "\n\n".join(_soup_paragraphs(soup))
 
 
 def html_to_paragraphs(html: str) -> List[str]:
@@ -156,21 +148,8 @@ def html_to_paragraphs(html: str) -> List[str]:
         Input: '<p>First para</p><p>Second para</p>'
         Output: ['First para', 'Second para']
     """
-    if not html or html.strip() == "":
+    soup = _clean_soup(html)
+    if soup is None:
         return []
 
-    soup = BeautifulSoup(html, "html.parser")
-
-    # Remove script and style tags
-    for script in soup(["script", "style"]):
-        script.decompose()
-
-    paragraphs = []
-
-    # TipTap uses <p> tags for paragraphs
-    for p_tag in soup.find_all("p"):
-        text = p_tag.get_text(separator=" ", strip=True)
-        if text:
-            paragraphs.append(text)
-
-    return paragraphs
+    return _soup_paragraphs(soup)